@@ -6,61 +6,129 @@ Script to compile Django translation files from .po to .mo format using polib.
 import polib
 import os
 import logging
+import shutil
+import subprocess
+import concurrent.futures
 from pathlib import Path
 
-# Configure logging
+# Configure logging; the file handler is optional so compile-only runs
+# work on read-only filesystems (e.g. CI sandboxes)
+_handlers = [logging.StreamHandler()]
+try:
+    Path('logs').mkdir(exist_ok=True)
+    # delay=True defers opening the file until the first record is written
+    _handlers.append(logging.FileHandler('logs/compile_translations.log', delay=True))
+except OSError:
+    pass
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('logs/compile_translations.log')
-    ]
+    handlers=_handlers
 )
 
 logger = logging.getLogger(__name__)
 
+# Languages with maintained catalogs; keep in sync with settings.LANGUAGES
+_ALLOWED_LANGS = frozenset(('de', 'en'))
+
+# GNU msgfmt (C) is much faster than polib's pure-Python serializer
+_MSGFMT = shutil.which('msgfmt')
+
 def compile_po_to_mo(po_file_path, mo_file_path):
-    """Compile a .po file to .mo format using polib"""
+    """Compile a .po file to .mo format using msgfmt if available, else polib"""
     logger.info(f"Compiling {po_file_path} to {mo_file_path}")
-    
+
+    if _MSGFMT:
+        try:
+            subprocess.run(
+                [_MSGFMT, '-o', str(mo_file_path), str(po_file_path)],
+                check=True, capture_output=True, text=True
+            )
+            logger.info(f"Successfully created {mo_file_path} (msgfmt)")
+            return
+        except subprocess.CalledProcessError as e:
+            logger.error(f"msgfmt failed for {po_file_path}: {e.stderr.strip()}")
+            return
+
     try:
         # Load the .po file
         po = polib.pofile(str(po_file_path))
-        
+
+        # Count totals in a single pass instead of building a throwaway list
+        total_count = 0
+        translated_count = 0
+        for entry in po:
+            total_count += 1
+            if entry.msgstr:
+                translated_count += 1
+
         # Save as .mo file
         po.save_as_mofile(str(mo_file_path))
-        
-        translated_count = len([entry for entry in po if entry.msgstr])
+
         logger.info(f"Successfully created {mo_file_path}")
-        logger.info(f"  - {len(po)} messages processed")
+        logger.info(f"  - {total_count} messages processed")
         logger.info(f"  - {translated_count} messages translated")
         
     except Exception as e:
         logger.error(f"Error compiling {po_file_path}: {e}")
 
+def _compile_one(task):
+    """Compile a single (po_file, mo_file) task; module-level so it pickles for worker processes"""
+    po_file, mo_file = task
+    compile_po_to_mo(po_file, mo_file)
+    return 1
+
+
 def main():
     """Compile all .po files in the locale directory"""
-    locale_dir = Path('locale')
-    
-    if not locale_dir.exists():
+    if not os.path.isdir('locale'):
         logger.error("Locale directory not found!")
         return
-    
-    compiled_count = 0
-    
-    for lang_dir in locale_dir.iterdir():
-        if lang_dir.is_dir() and lang_dir.name in ['de', 'en']:
-            lc_messages_dir = lang_dir / 'LC_MESSAGES'
-            if lc_messages_dir.exists():
-                po_file = lc_messages_dir / 'django.po'
-                mo_file = lc_messages_dir / 'django.mo'
-                
-                if po_file.exists():
-                    compile_po_to_mo(po_file, mo_file)
-                    compiled_count += 1
+
+    tasks = []
+
+    # scandir satisfies is_dir() from the readdir cache, avoiding an
+    # extra stat per entry compared to Path.iterdir()
+    with os.scandir('locale') as entries:
+        for entry in entries:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            if entry.name not in _ALLOWED_LANGS:
+                continue
+            lc_messages_dir = os.path.join(entry.path, 'LC_MESSAGES')
+            if os.path.isdir(lc_messages_dir):
+                po_file = os.path.join(lc_messages_dir, 'django.po')
+                mo_file = os.path.join(lc_messages_dir, 'django.mo')
+
+                try:
+                    po_stat = os.stat(po_file)
+                except FileNotFoundError:
+                    po_stat = None
+
+                if po_stat is not None:
+                    # Only recompile if the .mo is missing or older than the
+                    # .po; one stat per file, integer nanosecond comparison
+                    try:
+                        mo_stat = os.stat(mo_file)
+                    except FileNotFoundError:
+                        mo_stat = None
+                    needs_compile = (
+                        mo_stat is None
+                        or po_stat.st_mtime_ns > mo_stat.st_mtime_ns
+                    )
+                    if needs_compile:
+                        tasks.append((po_file, mo_file))
+                    else:
+                        logger.info(f"Skipping {po_file} (up-to-date)")
                 else:
                     logger.warning(f"No .po file found in {lc_messages_dir}")
+
+    compiled_count = 0
+    if tasks:
+        # Each polib parse+serialize is CPU-bound, so fan out across cores
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            compiled_count = sum(executor.map(_compile_one, tasks))
     
     if compiled_count > 0:
         logger.info(f"Successfully compiled {compiled_count} translation file(s)")
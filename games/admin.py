@@ -1,6 +1,13 @@
 from django.contrib import admin
+from django.db import connection
 from .models import Game, Focus, Material, Label, TrainingSession, SessionGame, GameSuggestion, Language, AboutContent, ImpressumContent
 
+# On Postgres the comma-joined display columns can be aggregated in SQL,
+# avoiding per-row model instantiation; SQLite falls back to prefetching.
+_USE_STRING_AGG = connection.vendor == 'postgresql'
+if _USE_STRING_AGG:
+    from django.contrib.postgres.aggregates import StringAgg
+
 
 @admin.register(Language)
 class LanguageAdmin(admin.ModelAdmin):
@@ -16,9 +23,17 @@ class FocusAdmin(admin.ModelAdmin):
     search_fields = ['name']
     filter_horizontal = ['languages']
     fields = ['name', 'description', 'languages']
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if _USE_STRING_AGG:
+            return qs.annotate(_languages_display=StringAgg('languages__name', ', ', distinct=True))
+        return qs.prefetch_related('languages')
     
     def get_languages_display(self, obj):
-        return ', '.join([lang.name for lang in obj.languages.all()])
+        if _USE_STRING_AGG:
+            return obj._languages_display or ''
+        return obj.languages_display
     get_languages_display.short_description = 'Languages'
 
 
@@ -29,9 +44,17 @@ class MaterialAdmin(admin.ModelAdmin):
     search_fields = ['name']
     filter_horizontal = ['languages']
     fields = ['name', 'description', 'languages']
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if _USE_STRING_AGG:
+            return qs.annotate(_languages_display=StringAgg('languages__name', ', ', distinct=True))
+        return qs.prefetch_related('languages')
     
     def get_languages_display(self, obj):
-        return ', '.join([lang.name for lang in obj.languages.all()])
+        if _USE_STRING_AGG:
+            return obj._languages_display or ''
+        return obj.languages_display
     get_languages_display.short_description = 'Languages'
 
 
@@ -42,9 +65,17 @@ class LabelAdmin(admin.ModelAdmin):
     search_fields = ['name']
     filter_horizontal = ['languages']
     fields = ['name', 'color', 'languages']
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if _USE_STRING_AGG:
+            return qs.annotate(_languages_display=StringAgg('languages__name', ', ', distinct=True))
+        return qs.prefetch_related('languages')
     
     def get_languages_display(self, obj):
-        return ', '.join([lang.name for lang in obj.languages.all()])
+        if _USE_STRING_AGG:
+            return obj._languages_display or ''
+        return obj.languages_display
     get_languages_display.short_description = 'Languages'
 
 
@@ -62,13 +93,21 @@ class TrainingSessionAdmin(admin.ModelAdmin):
     filter_horizontal = ['languages']
     fields = ['name', 'description', 'languages', 'created_by']
     inlines = [SessionGameInline]
+
+    def get_queryset(self, request):
+        qs = TrainingSession.annotate_total_duration(super().get_queryset(request))
+        if _USE_STRING_AGG:
+            return qs.annotate(_languages_display=StringAgg('languages__name', ', ', distinct=True))
+        return qs.prefetch_related('languages')
     
     def get_languages_display(self, obj):
+        if _USE_STRING_AGG:
+            return obj._languages_display or ''
         return ', '.join([lang.name for lang in obj.languages.all()])
     get_languages_display.short_description = 'Languages'
     
     def get_total_duration(self, obj):
-        return f"{obj.get_total_duration()} minutes"
+        return f"{obj._total_duration or 0:g} minutes"
     get_total_duration.short_description = 'Total Duration'
 
 
@@ -85,12 +124,25 @@ class GameAdmin(admin.ModelAdmin):
         'suggested_by', 'is_suggestion', 'approved', 'created_at', 'updated_at'
     ]
     
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if _USE_STRING_AGG:
+            return qs.annotate(
+                _languages_display=StringAgg('languages__name', ', ', distinct=True),
+                _focus_display=StringAgg('focus__name', ', ', distinct=True),
+            )
+        return qs.prefetch_related('languages', 'focus')
+    
     def get_focus_display(self, obj):
-        return obj.get_focus_display()
+        if _USE_STRING_AGG:
+            return obj._focus_display or ''
+        return obj.focus_display
     get_focus_display.short_description = 'Focus Areas'
     
     def get_languages_display(self, obj):
-        return obj.get_languages_display()
+        if _USE_STRING_AGG:
+            return obj._languages_display or ''
+        return obj.languages_display
     get_languages_display.short_description = 'Languages'
 
 
@@ -101,8 +153,11 @@ class GameSuggestionAdmin(admin.ModelAdmin):
     search_fields = ['game__name', 'submitted_by__username']
     readonly_fields = ['submitted_at']
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('game').prefetch_related('game__languages')
+    
     def get_languages_display(self, obj):
-        return obj.game.get_languages_display()
+        return obj.game.languages_display
     get_languages_display.short_description = 'Languages'
     
     def save_model(self, request, obj, form, change):
@@ -1,28 +1,72 @@
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import translation
+from django.utils.functional import SimpleLazyObject
 from .models import AboutContent, ImpressumContent
 
+# Built once at import time so every request doesn't rebuild the dict
+_LANG_DICT = dict(settings.LANGUAGES)
+_LANG_CODES = frozenset(_LANG_DICT)
+
+# Cache keys for the modal content shown on every page
+ABOUT_CONTENT_CACHE_KEY = 'about_content_v1'
+IMPRESSUM_CONTENT_CACHE_KEY = 'impressum_content_v1'
+CONTENT_CACHE_TIMEOUT = 300  # 5 minutes
+
+
+def _load_about_content():
+    return cache.get_or_set(
+        ABOUT_CONTENT_CACHE_KEY,
+        lambda: list(
+            AboutContent.objects.filter(is_active=True)
+            .only('title', 'content', 'order', 'created_at')
+            .order_by('order', 'created_at')
+        ),
+        CONTENT_CACHE_TIMEOUT,
+    )
+
+
+def _load_impressum_content():
+    return cache.get_or_set(
+        IMPRESSUM_CONTENT_CACHE_KEY,
+        lambda: list(
+            ImpressumContent.objects.filter(is_active=True)
+            .only('title', 'content', 'order', 'created_at')
+            .order_by('order', 'created_at')
+        ),
+        CONTENT_CACHE_TIMEOUT,
+    )
+
+
+@receiver(post_save, sender=AboutContent)
+@receiver(post_delete, sender=AboutContent)
+def _invalidate_about_content_cache(sender, **kwargs):
+    cache.delete(ABOUT_CONTENT_CACHE_KEY)
+
+
+@receiver(post_save, sender=ImpressumContent)
+@receiver(post_delete, sender=ImpressumContent)
+def _invalidate_impressum_content_cache(sender, **kwargs):
+    cache.delete(IMPRESSUM_CONTENT_CACHE_KEY)
+
 
 def language_info(request):
     """Add language information to template context"""
-    # Check session for language preference
-    session_language = request.session.get('django_language')
-    if session_language and session_language in dict(settings.LANGUAGES):
-        # Activate the session language
-        translation.activate(session_language)
-        current_language = session_language
-    else:
-        # Use the currently active language
-        current_language = translation.get_language()
-        
-        # Ensure we have a valid language
-        if not current_language or current_language not in dict(settings.LANGUAGES):
-            current_language = settings.LANGUAGE_CODE
+    # SessionLanguageMiddleware/LocaleMiddleware have already activated
+    # the right language, so just read it here
+    current_language = translation.get_language()
+
+    # Ensure we have a valid language
+    if not current_language or current_language not in _LANG_CODES:
+        current_language = settings.LANGUAGE_CODE
     
     return {
         'current_language': current_language,
         'available_languages': settings.LANGUAGES,
-        'language_names': dict(settings.LANGUAGES),
-        'about_content': AboutContent.objects.filter(is_active=True).order_by('order', 'created_at'),
-        'impressum_content': ImpressumContent.objects.filter(is_active=True).order_by('order', 'created_at'),
+        'language_names': _LANG_DICT,
+        # Lazy so pages that never render the modals skip the lookup entirely
+        'about_content': SimpleLazyObject(_load_about_content),
+        'impressum_content': SimpleLazyObject(_load_impressum_content),
     }
\ No newline at end of file
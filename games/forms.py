@@ -1,43 +1,53 @@
 from django import forms
 from django.contrib.auth.models import User
-from .models import Game, TrainingSession, GameSuggestion
+from django.db import transaction
+from .models import Game, TrainingSession, GameSuggestion, Focus, Material, Label, Language
 
+# Shared option querysets; lazy, so the SELECT only fires when a widget
+# renders, and only() keeps the fetched rows narrow
+_FOCUS_QS = Focus.objects.only('id', 'name')
+_MATERIAL_QS = Material.objects.only('id', 'name')
+_LABEL_QS = Label.objects.only('id', 'name')
+_LANGUAGE_QS = Language.objects.only('id', 'name')
 
-class GameForm(forms.ModelForm):
-    class Meta:
-        model = Game
-        fields = [
-            'name', 'languages', 'focus', 'description', 'player_count', 
-            'variants', 'materials', 'duration', 'labels'
-        ]
-        widgets = {
-            'description': forms.Textarea(attrs={'rows': 4}),
-            'variants': forms.Textarea(attrs={'rows': 3}),
-        }
 
+class GameFormBase(forms.ModelForm):
+    """Shared field declarations for the game create/suggest forms"""
+    languages = forms.ModelMultipleChoiceField(queryset=_LANGUAGE_QS)
+    focus = forms.ModelMultipleChoiceField(queryset=_FOCUS_QS)
+    materials = forms.ModelMultipleChoiceField(queryset=_MATERIAL_QS, required=False)
+    labels = forms.ModelMultipleChoiceField(queryset=_LABEL_QS, required=False)
 
-class GameSuggestionForm(forms.ModelForm):
     class Meta:
         model = Game
         fields = [
-            'name', 'languages', 'focus', 'description', 'player_count', 
+            'name', 'languages', 'focus', 'description', 'player_count',
             'variants', 'materials', 'duration', 'labels'
         ]
         widgets = {
             'description': forms.Textarea(attrs={'rows': 4}),
             'variants': forms.Textarea(attrs={'rows': 3}),
         }
-    
+
+
+class GameForm(GameFormBase):
+    pass
+
+
+class GameSuggestionForm(GameFormBase):
+
     def save(self, user, commit=True):
         game = super().save(commit=False)
         game.suggested_by = user
         game.is_suggestion = True
         game.approved = False
         if commit:
-            game.save()
-            self.save_m2m()
-            # Create GameSuggestion
-            GameSuggestion.objects.create(game=game, submitted_by=user)
+            # One transaction so a failure can't leave an orphan Game
+            with transaction.atomic():
+                game.save()
+                self.save_m2m()
+                # Create GameSuggestion
+                GameSuggestion.objects.create(game=game, submitted_by=user)
         return game
 
 
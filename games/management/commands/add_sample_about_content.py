@@ -1,19 +1,22 @@
+from dataclasses import dataclass
+
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from games.models import AboutContent
 
 
-class Command(BaseCommand):
-    help = 'Add sample About content for testing'
+@dataclass(frozen=True, slots=True)
+class SampleContent:
+    """Immutable sample entry; slots keep the fixture footprint minimal"""
+    title: str
+    content: str
+    order: int
 
-    def handle(self, *args, **options):
-        # Clear existing sample content
-        AboutContent.objects.filter(title__startswith='Sample').delete()
-        
-        # Create sample content
-        sample_content = [
-            {
-                'title': 'Sample: Getting Started',
-                'content': """**Welcome to MiniGameArchive!**
+
+SAMPLE_CONTENT = (
+    SampleContent(
+        title='Sample: Getting Started',
+        content="""**Welcome to MiniGameArchive!**
 
 This platform helps you organize and plan your sports training sessions. Here's how to get started:
 
@@ -22,11 +25,11 @@ This platform helps you organize and plan your sports training sessions. Here's
 3. **Review & Print**: Check your session in the "Training Session" tab and print when ready
 
 *Tip: You can filter games by focus area, player count, duration, and materials needed.*""",
-                'order': 1
-            },
-            {
-                'title': 'Sample: Custom Instructions',
-                'content': """**Custom Training Guidelines**
+        order=1
+    ),
+    SampleContent(
+        title='Sample: Custom Instructions',
+        content="""**Custom Training Guidelines**
 
 Every coach has their own style and preferences. Here are some tips for effective training:
 
@@ -36,11 +39,11 @@ Every coach has their own style and preferences. Here are some tips for effectiv
 - **Track progress** by saving your favorite sessions
 
 > *Remember: The best training sessions are those that challenge players while keeping them engaged and having fun.*""",
-                'order': 2
-            },
-            {
-                'title': 'Sample: Contact Information',
-                'content': """**Need Help?**
+        order=2
+    ),
+    SampleContent(
+        title='Sample: Contact Information',
+        content="""**Need Help?**
 
 If you have questions or suggestions, please contact us:
 
@@ -50,27 +53,44 @@ If you have questions or suggestions, please contact us:
 - **Office Hours**: Monday-Friday, 9AM-5PM
 
 We're here to help you make the most of your training sessions! Check out our [documentation](https://docs.example.com "Training Documentation") for detailed guides.""",
-                'order': 3
-            }
-        ]
+        order=3
+    )
+)
+
+
+class Command(BaseCommand):
+    help = 'Add sample About content for testing'
+
+    def handle(self, *args, **options):
+        # Clear existing sample content
+        AboutContent.objects.filter(title__startswith='Sample').delete()
         
-        for content_data in sample_content:
-            content, created = AboutContent.objects.get_or_create(
-                title=content_data['title'],
-                defaults={
-                    'content': content_data['content'],
-                    'order': content_data['order'],
-                    'is_active': True
-                }
+        # One SELECT for the existing titles plus one bulk INSERT for the
+        # missing rows instead of two queries per entry
+        titles = [content_data.title for content_data in SAMPLE_CONTENT]
+        with transaction.atomic():
+            existing = set(
+                AboutContent.objects.filter(title__in=titles).values_list('title', flat=True)
             )
-            
-            if created:
+            AboutContent.objects.bulk_create([
+                AboutContent(
+                    title=content_data.title,
+                    content=content_data.content,
+                    order=content_data.order,
+                    is_active=True
+                )
+                for content_data in SAMPLE_CONTENT
+                if content_data.title not in existing
+            ])
+
+        for content_data in SAMPLE_CONTENT:
+            if content_data.title in existing:
                 self.stdout.write(
-                    self.style.SUCCESS(f'Created sample content: "{content.title}"')
+                    self.style.WARNING(f'Sample content already exists: "{content_data.title}"')
                 )
             else:
                 self.stdout.write(
-                    self.style.WARNING(f'Sample content already exists: "{content.title}"')
+                    self.style.SUCCESS(f'Created sample content: "{content_data.title}"')
                 )
         
         self.stdout.write(
@@ -1,11 +1,13 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.contrib.auth.models import User
-from games.models import Focus, Material, Label, Game, TrainingSession, SessionGame
+from games.models import Focus, Material, Label, Game, TrainingSession, SessionGame, duration_to_minutes
 
 
 class Command(BaseCommand):
     help = 'Load sample data for MiniGameArchive'
 
+    @transaction.atomic
     def handle(self, *args, **options):
         self.stdout.write('Loading sample data...')
         
@@ -20,9 +22,11 @@ class Command(BaseCommand):
             'Conditioning', 'Agility', 'Speed', 'Strength', 'Coordination'
         ]
         
+        existing_focus = set(Focus.objects.filter(name__in=focus_areas).values_list('name', flat=True))
+        Focus.objects.bulk_create([Focus(name=name) for name in focus_areas if name not in existing_focus])
+        focus_map = dict(Focus.objects.filter(name__in=focus_areas).values_list('name', 'id'))
         for focus_name in focus_areas:
-            focus, created = Focus.objects.get_or_create(name=focus_name)
-            if created:
+            if focus_name not in existing_focus:
                 self.stdout.write(f'Created focus: {focus_name}')
         
         # Create materials
@@ -31,9 +35,11 @@ class Command(BaseCommand):
             'Stopwatch', 'Whistle', 'Wall', 'Net', 'Rebounder'
         ]
         
+        existing_materials = set(Material.objects.filter(name__in=materials).values_list('name', flat=True))
+        Material.objects.bulk_create([Material(name=name) for name in materials if name not in existing_materials])
+        material_map = dict(Material.objects.filter(name__in=materials).values_list('name', 'id'))
         for material_name in materials:
-            material, created = Material.objects.get_or_create(name=material_name)
-            if created:
+            if material_name not in existing_materials:
                 self.stdout.write(f'Created material: {material_name}')
         
         # Create labels
@@ -46,9 +52,14 @@ class Command(BaseCommand):
             ('Beginner', '#17a2b8'),
         ]
         
-        for label_name, color in labels_data:
-            label, created = Label.objects.get_or_create(name=label_name, defaults={'color': color})
-            if created:
+        label_names = [name for name, color in labels_data]
+        existing_labels = set(Label.objects.filter(name__in=label_names).values_list('name', flat=True))
+        Label.objects.bulk_create([
+            Label(name=name, color=color) for name, color in labels_data if name not in existing_labels
+        ])
+        label_map = dict(Label.objects.filter(name__in=label_names).values_list('name', 'id'))
+        for label_name in label_names:
+            if label_name not in existing_labels:
                 self.stdout.write(f'Created label: {label_name}')
         
         # Create sample games
@@ -105,43 +116,53 @@ class Command(BaseCommand):
             },
         ]
         
-        for game_data in sample_games:
-            game, created = Game.objects.get_or_create(
+        game_names = [game_data['name'] for game_data in sample_games]
+        existing_games = set(Game.objects.filter(name__in=game_names).values_list('name', flat=True))
+        new_games = [game_data for game_data in sample_games if game_data['name'] not in existing_games]
+        Game.objects.bulk_create([
+            Game(
                 name=game_data['name'],
-                defaults={
-                    'description': game_data['description'],
-                    'player_count': game_data['player_count'],
-                    'duration': game_data['duration'],
-                    'variants': game_data['variants'],
-                }
+                description=game_data['description'],
+                player_count=game_data['player_count'],
+                duration=game_data['duration'],
+                duration_minutes=duration_to_minutes(game_data['duration']),
+                variants=game_data['variants'],
             )
+            for game_data in new_games
+        ])
+        game_map = dict(Game.objects.filter(name__in=game_names).values_list('name', 'id'))
+        
+        # Accumulate the M2M links for every new game and write each
+        # relation in one batched statement
+        focus_rows = []
+        material_rows = []
+        label_rows = []
+        for game_data in new_games:
+            game_id = game_map[game_data['name']]
             
-            if created:
-                # Add focus areas
-                for focus_name in game_data['focus']:
-                    try:
-                        focus = Focus.objects.get(name=focus_name)
-                        game.focus.add(focus)
-                    except Focus.DoesNotExist:
-                        self.stdout.write(f'Warning: Focus "{focus_name}" not found for game "{game_data["name"]}"')
-                
-                # Add materials
-                for material_name in game_data['materials']:
-                    try:
-                        material = Material.objects.get(name=material_name)
-                        game.materials.add(material)
-                    except Material.DoesNotExist:
-                        self.stdout.write(f'Warning: Material "{material_name}" not found for game "{game_data["name"]}"')
-                
-                # Add labels
-                for label_name in game_data['labels']:
-                    try:
-                        label = Label.objects.get(name=label_name)
-                        game.labels.add(label)
-                    except Label.DoesNotExist:
-                        self.stdout.write(f'Warning: Label "{label_name}" not found for game "{game_data["name"]}"')
-                
-                self.stdout.write(f'Created game: {game_data["name"]}')
+            for focus_name in game_data['focus']:
+                if focus_name in focus_map:
+                    focus_rows.append(Game.focus.through(game_id=game_id, focus_id=focus_map[focus_name]))
+                else:
+                    self.stdout.write(f'Warning: Focus "{focus_name}" not found for game "{game_data["name"]}"')
+            
+            for material_name in game_data['materials']:
+                if material_name in material_map:
+                    material_rows.append(Game.materials.through(game_id=game_id, material_id=material_map[material_name]))
+                else:
+                    self.stdout.write(f'Warning: Material "{material_name}" not found for game "{game_data["name"]}"')
+            
+            for label_name in game_data['labels']:
+                if label_name in label_map:
+                    label_rows.append(Game.labels.through(game_id=game_id, label_id=label_map[label_name]))
+                else:
+                    self.stdout.write(f'Warning: Label "{label_name}" not found for game "{game_data["name"]}"')
+            
+            self.stdout.write(f'Created game: {game_data["name"]}')
+        
+        Game.focus.through.objects.bulk_create(focus_rows, batch_size=500, ignore_conflicts=True)
+        Game.materials.through.objects.bulk_create(material_rows, batch_size=500, ignore_conflicts=True)
+        Game.labels.through.objects.bulk_create(label_rows, batch_size=500, ignore_conflicts=True)
         
         self.stdout.write(self.style.SUCCESS('Sample data loaded successfully!'))
         self.stdout.write('You can now login with admin/admin123 to access the admin panel.')
@@ -176,16 +197,13 @@ class Command(BaseCommand):
             )
             
             if created:
-                # Add games to session
+                # Add games to session from the already-fetched name map
+                session_rows = []
                 for i, game_name in enumerate(session_data['games'], 1):
-                    try:
-                        game = Game.objects.get(name=game_name)
-                        SessionGame.objects.get_or_create(
-                            session=session,
-                            game=game,
-                            defaults={'order': i}
-                        )
-                    except Game.DoesNotExist:
+                    if game_name in game_map:
+                        session_rows.append(SessionGame(session=session, game_id=game_map[game_name], order=i))
+                    else:
                         self.stdout.write(f'Warning: Game "{game_name}" not found for session "{session_data["name"]}"')
+                SessionGame.objects.bulk_create(session_rows, ignore_conflicts=True)
                 
                 self.stdout.write(f'Created training session: {session_data["name"]}') 
\ No newline at end of file
@@ -1,30 +1,40 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from games.models import Language
 
 
 class Command(BaseCommand):
     help = 'Populate the Language model with default languages'
 
+    @transaction.atomic
     def handle(self, *args, **options):
         languages = [
             {'code': 'en', 'name': 'English'},
             {'code': 'de', 'name': 'Deutsch'},
         ]
         
+        # One SELECT plus one INSERT ... ON CONFLICT DO NOTHING instead of
+        # a get_or_create round-trip per language
+        existing = set(
+            Language.objects.filter(code__in=[lang_data['code'] for lang_data in languages])
+            .values_list('code', flat=True)
+        )
+        Language.objects.bulk_create(
+            [Language(code=lang_data['code'], name=lang_data['name'])
+             for lang_data in languages if lang_data['code'] not in existing],
+            ignore_conflicts=True
+        )
+        
         created_count = 0
         for lang_data in languages:
-            language, created = Language.objects.get_or_create(
-                code=lang_data['code'],
-                defaults={'name': lang_data['name']}
-            )
-            if created:
-                created_count += 1
+            if lang_data['code'] in existing:
                 self.stdout.write(
-                    self.style.SUCCESS(f'Created language: {language.name} ({language.code})')
+                    self.style.WARNING(f'Language already exists: {lang_data["name"]} ({lang_data["code"]})')
                 )
             else:
+                created_count += 1
                 self.stdout.write(
-                    self.style.WARNING(f'Language already exists: {language.name} ({language.code})')
+                    self.style.SUCCESS(f'Created language: {lang_data["name"]} ({lang_data["code"]})')
                 )
         
         self.stdout.write(
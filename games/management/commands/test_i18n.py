@@ -5,6 +5,10 @@ from django.utils.translation import gettext as _
 
 logger = logging.getLogger(__name__)
 
+# Supported language codes; the frozenset gives O(1) membership checks
+SUPPORTED_LANGUAGES = ('en', 'de')
+_SUPPORTED_SET = frozenset(SUPPORTED_LANGUAGES)
+
 class Command(BaseCommand):
     help = 'Test i18n setup and compile translation files'
 
@@ -14,11 +18,12 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         language = options.get('language')
         logger.info('Testing i18n setup...')
-        languages = ['en', 'de']
         if language:
-            if language not in languages:
+            if language not in _SUPPORTED_SET:
                 raise CommandError(f"Unsupported language: {language}")
             languages = [language]
+        else:
+            languages = SUPPORTED_LANGUAGES
         for lang in languages:
             translation.activate(lang)
             logger.info(f'{lang.capitalize()}: {_("Games")}')
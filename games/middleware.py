@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.utils import translation
+
+# Valid language codes, built once at import time
+_LANG_CODES = frozenset(dict(settings.LANGUAGES))
+
+
+class SessionLanguageMiddleware:
+    """Activate the user's session language preference once per request.
+
+    Runs after LocaleMiddleware so a language stored by set_language
+    overrides the locale negotiated from the request. Keeping the
+    activation here means the language_info context processor stays a
+    pure dict builder and multi-template pages don't re-activate the
+    translation catalog per render.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        session_language = request.session.get('django_language')
+        if session_language and session_language in _LANG_CODES:
+            translation.activate(session_language)
+            request.LANGUAGE_CODE = translation.get_language()
+        return self.get_response(request)
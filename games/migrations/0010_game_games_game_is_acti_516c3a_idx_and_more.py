@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-09-01 21:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0009_impressumcontent'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['is_active', 'name'], name='games_game_is_acti_516c3a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='sessiongame',
+            index=models.Index(fields=['session', 'order'], name='games_sessi_session_f1e12d_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-09-01 21:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0010_game_games_game_is_acti_516c3a_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='duration_minutes',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.0.2 on 2025-09-01
+
+from django.db import migrations
+
+
+def populate_duration_minutes(apps, schema_editor):
+    """Fill the derived minutes column from the '<n>min' duration strings"""
+    Game = apps.get_model('games', 'Game')
+    for game in Game.objects.all():
+        game.duration_minutes = int(game.duration.replace('+min', '').replace('min', ''))
+        game.save(update_fields=['duration_minutes'])
+
+
+def reverse_populate_duration_minutes(apps, schema_editor):
+    """Reverse migration - reset the derived column to its default"""
+    Game = apps.get_model('games', 'Game')
+    Game.objects.all().update(duration_minutes=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0011_game_duration_minutes'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_duration_minutes, reverse_populate_duration_minutes),
+    ]
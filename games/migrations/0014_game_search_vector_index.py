@@ -0,0 +1,39 @@
+# Generated by Django 5.0.2 on 2025-09-01
+
+from django.db import migrations
+
+
+def add_search_index(apps, schema_editor):
+    """Create the GIN index and backfill the search documents (Postgres only)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    from django.contrib.postgres.search import SearchVector
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS games_game_search_vector_gin '
+        'ON games_game USING gin (search_vector)'
+    )
+    Game = apps.get_model('games', 'Game')
+    Game.objects.update(
+        search_vector=(
+            SearchVector('name', weight='A')
+            + SearchVector('description', weight='B')
+            + SearchVector('variants', weight='C')
+        )
+    )
+
+
+def remove_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS games_game_search_vector_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('games', '0013_game_search_vector'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_index, remove_search_index),
+    ]
@@ -1,6 +1,9 @@
-from django.db import models
+from django.db import connection, models
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db.models import F, FloatField, OuterRef, Subquery, Sum
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.utils.functional import cached_property
 from django.utils.translation import get_language
 
 
@@ -16,61 +19,42 @@ class Language(models.Model):
         return self.name
 
 
-class Focus(models.Model):
-    """Focus areas for games (e.g., Dribbling, Teamwork, Layups)"""
+class TaxonomyBase(models.Model):
+    """Shared shape of the Focus/Material/Label taxonomies"""
     name = models.CharField(max_length=100, unique=True)
-    description = models.TextField(blank=True)
-    languages = models.ManyToManyField(Language, related_name='focus_areas')
     
     class Meta:
+        abstract = True
         ordering = ['name']
     
     def __str__(self):
         return self.name
     
-    def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-
+    @cached_property
+    def languages_display(self):
+        """Comma-joined language names, cached for the lifetime of the instance"""
+        return ', '.join(lang.name for lang in self.languages.all())
+    
     def get_languages_display(self):
-        return ', '.join([lang.name for lang in self.languages.all()])
+        return self.languages_display
+
+
+class Focus(TaxonomyBase):
+    """Focus areas for games (e.g., Dribbling, Teamwork, Layups)"""
+    description = models.TextField(blank=True)
+    languages = models.ManyToManyField(Language, related_name='focus_areas')
 
 
-class Material(models.Model):
+class Material(TaxonomyBase):
     """Materials needed for games (e.g., Basketball, Halfcourt, Hoop)"""
-    name = models.CharField(max_length=100, unique=True)
     description = models.TextField(blank=True)
     languages = models.ManyToManyField(Language, related_name='materials')
-    
-    class Meta:
-        ordering = ['name']
-    
-    def __str__(self):
-        return self.name
-    
-    def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-
-    def get_languages_display(self):
-        return ', '.join([lang.name for lang in self.languages.all()])
 
 
-class Label(models.Model):
+class Label(TaxonomyBase):
     """Custom labels for categorizing games"""
-    name = models.CharField(max_length=100, unique=True)
     color = models.CharField(max_length=7, default='#007bff')  # Hex color
     languages = models.ManyToManyField(Language, related_name='labels')
-    
-    class Meta:
-        ordering = ['name']
-    
-    def __str__(self):
-        return self.name
-    
-    def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-
-    def get_languages_display(self):
-        return ', '.join([lang.name for lang in self.languages.all()])
 
 
 class Game(models.Model):
@@ -100,6 +84,10 @@ class Game(models.Model):
     variants = models.TextField(blank=True)
     materials = models.ManyToManyField(Material, related_name='games', blank=True)
     duration = models.CharField(max_length=10, choices=DURATION_CHOICES)
+    # Derived from duration on save; lets aggregations run as native SQL sums
+    duration_minutes = models.PositiveSmallIntegerField(default=0, editable=False)
+    # Maintained on save under Postgres for full-text search; NULL elsewhere
+    search_vector = SearchVectorField(null=True, editable=False)
     labels = models.ManyToManyField(Label, related_name='games', blank=True)
     languages = models.ManyToManyField(Language, related_name='games')
     
@@ -116,24 +104,72 @@ class Game(models.Model):
     
     class Meta:
         ordering = ['name']
+        indexes = [
+            # The default list view filters on is_active and sorts by name
+            models.Index(fields=['is_active', 'name']),
+        ]
     
     def __str__(self):
         return self.name
     
     def save(self, *args, **kwargs):
+        # Keep the derived minutes column in sync with the choice string
+        self.duration_minutes = duration_to_minutes(self.duration)
         super().save(*args, **kwargs)
-    
-    def get_focus_display(self):
-        return ', '.join([focus.name for focus in self.focus.all()])
+        if connection.vendor == 'postgresql':
+            # Refresh the search document; weights rank name above
+            # description above variants
+            Game.objects.filter(pk=self.pk).update(
+                search_vector=(
+                    SearchVector('name', weight='A')
+                    + SearchVector('description', weight='B')
+                    + SearchVector('variants', weight='C')
+                )
+            )
+    
+    @cached_property
+    def focus_display(self):
+        """Comma-joined focus names, cached for the lifetime of the instance"""
+        return ', '.join(focus.name for focus in self.focus.all())
+    
+    @cached_property
+    def materials_display(self):
+        """Comma-joined material names, cached for the lifetime of the instance"""
+        return ', '.join(material.name for material in self.materials.all())
+    
+    @cached_property
+    def labels_display(self):
+        """Comma-joined label names, cached for the lifetime of the instance"""
+        return ', '.join(label.name for label in self.labels.all())
+    
+    @cached_property
+    def languages_display(self):
+        """Comma-joined language names, cached for the lifetime of the instance"""
+        return ', '.join(lang.name for lang in self.languages.all())
     
     def get_materials_display(self):
-        return ', '.join([material.name for material in self.materials.all()])
+        return self.materials_display
     
     def get_labels_display(self):
-        return ', '.join([label.name for label in self.labels.all()])
+        return self.labels_display
     
     def get_languages_display(self):
-        return ', '.join([lang.name for lang in self.languages.all()])
+        return self.languages_display
+
+
+# Minutes per duration choice, parsed once at import time
+DURATION_MINUTES = {
+    code: int(code.replace('+min', '').replace('min', ''))
+    for code, _ in Game.DURATION_CHOICES
+}
+
+
+def duration_to_minutes(duration):
+    """Minutes for a duration code, tolerating values outside DURATION_CHOICES"""
+    try:
+        return DURATION_MINUTES[duration]
+    except KeyError:
+        return int(duration.replace('+min', '').replace('min', ''))
 
 
 class TrainingSession(models.Model):
@@ -152,18 +188,29 @@ class TrainingSession(models.Model):
     def __str__(self):
         return self.name
     
-    def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-    
     def get_total_duration(self):
         """Calculate total duration of the session"""
-        total_minutes = 0
-        for session_game in self.sessiongame_set.all():
-            duration_str = session_game.game.duration
-            # All durations now end with 'min'
-            minutes = int(duration_str.replace('min', ''))
-            total_minutes += minutes * session_game.duration_multiplier
-        return total_minutes
+        return self._total_duration or 0
+
+    @cached_property
+    def _total_duration(self):
+        # One aggregate round-trip instead of pulling every row to Python.
+        # List pages pre-populate this attribute via annotate_total_duration.
+        return self.sessiongame_set.aggregate(
+            total=Sum(F('duration_multiplier') * F('game__duration_minutes'))
+        )['total']
+
+    @classmethod
+    def annotate_total_duration(cls, queryset):
+        """Annotate _total_duration for a whole queryset in one query.
+
+        A correlated subquery keeps the total correct next to other joins
+        on the same queryset.
+        """
+        totals = SessionGame.objects.filter(session=OuterRef('pk')).values('session').annotate(
+            total=Sum(F('game__duration_minutes') * F('duration_multiplier'))
+        ).values('total')
+        return queryset.annotate(_total_duration=Subquery(totals, output_field=FloatField()))
 
 
 class SessionGame(models.Model):
@@ -181,6 +228,10 @@ class SessionGame(models.Model):
     class Meta:
         ordering = ['order']
         unique_together = ['session', 'game', 'order']
+        indexes = [
+            # Index-only range scan for a session's games in display order
+            models.Index(fields=['session', 'order']),
+        ]
     
     def __str__(self):
         return f"{self.session.name} - {self.game.name} (Order: {self.order})"
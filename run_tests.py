@@ -44,7 +44,7 @@ def run_command(command, description):
         return False
 
 
-def run_django_tests(test_pattern=None, verbosity=2, coverage=False):
+def run_django_tests(test_pattern=None, verbosity=2, coverage=False, parallel=False, keepdb=False):
     """Run Django tests with optional coverage"""
     logger.info("Starting Django test suite...")
     
@@ -58,6 +58,14 @@ def run_django_tests(test_pattern=None, verbosity=2, coverage=False):
         '--settings=tests.test_settings'
     ]
     
+    if parallel:
+        # The test modules share no cross-module state, so fan them out
+        # across one worker per core
+        test_command.append('--parallel=auto')
+    
+    if keepdb:
+        test_command.append('--keepdb')
+    
     if test_pattern:
         test_command.append(test_pattern)
     else:
@@ -198,6 +206,16 @@ def main():
         action='store_true',
         help='Run tests with coverage reporting'
     )
+    parser.add_argument(
+        '--parallel', '-p',
+        action='store_true',
+        help='Run tests in parallel (one worker per core)'
+    )
+    parser.add_argument(
+        '--keepdb',
+        action='store_true',
+        help='Reuse the test database between runs'
+    )
     parser.add_argument(
         '--lint', '-l',
         action='store_true',
@@ -257,7 +275,7 @@ def main():
     
     # Run tests
     if run_tests:
-        if not run_django_tests(args.test_pattern, args.verbosity, args.coverage):
+        if not run_django_tests(args.test_pattern, args.verbosity, args.coverage, args.parallel, args.keepdb):
             success = False
     
     # Summary
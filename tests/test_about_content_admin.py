@@ -7,16 +7,38 @@ from games.models import AboutContent
 class AboutContentAdminTest(TestCase):
     """Test the AboutContent admin functionality"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.client = Client()
-        self.admin_user = User.objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls):
+        """Class-scoped fixtures; creating (and hashing) the superuser once"""
+        # force_login means no test exercises the password flow, so skip
+        # hashing one at all
+        cls.admin_user = User.objects.create_superuser(
             username='admin',
             email='admin@example.com',
-            password='adminpass123'
+            password=None
         )
-        self.client.login(username='admin', password='adminpass123')
-        
+        # Shared rows for the ordering/filter/search tests
+        cls.second_content = AboutContent.objects.create(
+            title='Second Content',
+            content='Second content',
+            is_active=True,
+            order=2
+        )
+        cls.inactive_content = AboutContent.objects.create(
+            title='Inactive Content',
+            content='Inactive content',
+            is_active=False,
+            order=3
+        )
+        # Resolve the static admin URLs once per class
+        cls.changelist_url = reverse('admin:games_aboutcontent_changelist')
+        cls.add_url = reverse('admin:games_aboutcontent_add')
+
+    def setUp(self):
+        """Set up per-test state"""
+        self.client = Client()
+        self.client.force_login(self.admin_user)
+
         # Create test content
         self.about_content = AboutContent.objects.create(
             title='Test Content',
@@ -27,8 +49,10 @@ class AboutContentAdminTest(TestCase):
     
     def test_about_content_admin_list(self):
         """Test that AboutContent appears in admin list"""
-        response = self.client.get(reverse('admin:games_aboutcontent_changelist'))
-        self.assertEqual(response.status_code, 200)
+        # Session/auth plus the changelist COUNT and row SELECTs; a new FK
+        # in list_display would show up here as an N+1 regression
+        with self.assertNumQueries(5):
+            response = self.client.get(self.changelist_url)
         self.assertContains(response, 'Test Content')
         self.assertContains(response, 'Active')
     
@@ -37,7 +61,6 @@ class AboutContentAdminTest(TestCase):
         response = self.client.get(
             reverse('admin:games_aboutcontent_change', args=[self.about_content.id])
         )
-        self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Test Content')
         self.assertContains(response, '**Bold text** and *italic text*')
     
@@ -51,7 +74,7 @@ class AboutContentAdminTest(TestCase):
         }
         
         response = self.client.post(
-            reverse('admin:games_aboutcontent_add'),
+            self.add_url,
             data
         )
         
@@ -101,50 +124,24 @@ class AboutContentAdminTest(TestCase):
     
     def test_about_content_ordering(self):
         """Test that AboutContent is ordered correctly in admin"""
-        # Create content with different order
-        AboutContent.objects.create(
-            title='Second Content',
-            content='Second content',
-            is_active=True,
-            order=2
-        )
-        
-        response = self.client.get(reverse('admin:games_aboutcontent_changelist'))
-        self.assertEqual(response.status_code, 200)
-        
-        # Get the response content
-        content = response.content.decode()
-        
-        # Find positions of the content
-        first_pos = content.find('Test Content')
-        second_pos = content.find('Second Content')
-        
-        # First content should appear before second content (due to order)
-        self.assertLess(first_pos, second_pos)
+        # The admin queryset orders by (order, created_at); assert the
+        # contract directly instead of scanning the rendered HTML
+        titles = list(AboutContent.objects.values_list('title', flat=True))
+        self.assertEqual(titles, ['Test Content', 'Second Content', 'Inactive Content'])
     
     def test_about_content_filtering(self):
         """Test that AboutContent admin filters work"""
-        # Create inactive content
-        AboutContent.objects.create(
-            title='Inactive Content',
-            content='Inactive content',
-            is_active=False,
-            order=3
-        )
-        
         # Test active filter
         response = self.client.get(
-            reverse('admin:games_aboutcontent_changelist') + '?is_active__exact=1'
+            self.changelist_url + '?is_active__exact=1'
         )
-        self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Test Content')
         self.assertNotContains(response, 'Inactive Content')
         
         # Test inactive filter
         response = self.client.get(
-            reverse('admin:games_aboutcontent_changelist') + '?is_active__exact=0'
+            self.changelist_url + '?is_active__exact=0'
         )
-        self.assertEqual(response.status_code, 200)
         self.assertNotContains(response, 'Test Content')
         self.assertContains(response, 'Inactive Content')
     
@@ -152,21 +149,18 @@ class AboutContentAdminTest(TestCase):
         """Test that AboutContent admin search works"""
         # Search by title
         response = self.client.get(
-            reverse('admin:games_aboutcontent_changelist') + '?q=Test'
+            self.changelist_url + '?q=Test'
         )
-        self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Test Content')
         
         # Search by content
         response = self.client.get(
-            reverse('admin:games_aboutcontent_changelist') + '?q=Bold'
+            self.changelist_url + '?q=Bold'
         )
-        self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Test Content')
         
         # Search for non-existent content
         response = self.client.get(
-            reverse('admin:games_aboutcontent_changelist') + '?q=Nonexistent'
+            self.changelist_url + '?q=Nonexistent'
         )
-        self.assertEqual(response.status_code, 200)
         self.assertNotContains(response, 'Test Content') 
\ No newline at end of file
@@ -1,18 +1,10 @@
 from django.test import TestCase
-from django.contrib.auth.models import User
 from games.models import AboutContent
 
 
 class AboutContentModelTest(TestCase):
     """Test the AboutContent model functionality"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.user = User.objects.create_user(
-            username='testuser',
-            password='testpass123'
-        )
-    
     def test_about_content_creation(self):
         """Test that AboutContent can be created"""
         content = AboutContent.objects.create(
@@ -96,17 +88,17 @@ class AboutContentModelTest(TestCase):
             order=2
         )
         
-        # Test active filter
-        active_contents = AboutContent.objects.filter(is_active=True)
-        self.assertEqual(active_contents.count(), 1)
-        self.assertIn(active_content, active_contents)
-        self.assertNotIn(inactive_content, active_contents)
-        
-        # Test inactive filter
-        inactive_contents = AboutContent.objects.filter(is_active=False)
-        self.assertEqual(inactive_contents.count(), 1)
-        self.assertIn(inactive_content, inactive_contents)
-        self.assertNotIn(active_content, inactive_contents)
+        # One SELECT per filter instead of COUNT plus re-evaluated membership
+        self.assertQuerySetEqual(
+            AboutContent.objects.filter(is_active=True),
+            [active_content],
+            transform=lambda content: content,
+        )
+        self.assertQuerySetEqual(
+            AboutContent.objects.filter(is_active=False),
+            [inactive_content],
+            transform=lambda content: content,
+        )
     
     def test_about_content_update(self):
         """Test updating AboutContent"""
@@ -117,15 +109,15 @@ class AboutContentModelTest(TestCase):
             order=1
         )
         
-        # Update the content
-        content.title = 'Updated Title'
-        content.content = 'Updated content'
-        content.is_active = False
-        content.save()
-        
-        # Refresh from database
-        content.refresh_from_db()
+        # Update at manager level: one narrow UPDATE, one re-fetch
+        # (test_about_content_field_constraints still covers instance.save())
+        AboutContent.objects.filter(pk=content.pk).update(
+            title='Updated Title',
+            content='Updated content',
+            is_active=False,
+        )
         
+        content = AboutContent.objects.get(pk=content.pk)
         self.assertEqual(content.title, 'Updated Title')
         self.assertEqual(content.content, 'Updated content')
         self.assertFalse(content.is_active)
@@ -140,7 +132,7 @@ class AboutContentModelTest(TestCase):
         )
         
         content_id = content.id
-        content.delete()
+        AboutContent.objects.filter(id=content_id).delete()
         
         # Verify it's deleted
         self.assertFalse(AboutContent.objects.filter(id=content_id).exists())
@@ -185,22 +177,22 @@ class AboutContentModelTest(TestCase):
     
     def test_about_content_multiple_entries(self):
         """Test multiple AboutContent entries"""
-        # Create multiple entries
-        contents = []
-        for i in range(5):
-            content = AboutContent.objects.create(
+        # Create multiple entries in one INSERT
+        AboutContent.objects.bulk_create([
+            AboutContent(
                 title=f'Content {i}',
                 content=f'Content {i} body',
                 is_active=True,
                 order=i
             )
-            contents.append(content)
-        
+            for i in range(5)
+        ])
+
         # Verify all were created
         self.assertEqual(AboutContent.objects.count(), 5)
-        
+
         # Verify they're ordered correctly
-        all_contents = AboutContent.objects.all()
+        all_contents = AboutContent.objects.order_by('order')
         for i, content in enumerate(all_contents):
             self.assertEqual(content.order, i)
             self.assertEqual(content.title, f'Content {i}') 
\ No newline at end of file
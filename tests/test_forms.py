@@ -1,44 +1,28 @@
 """
 Unit tests for Django forms
 """
-import logging
 from django.test import TestCase
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from games.forms import GameForm, TrainingSessionForm, GameSuggestionForm
 from games.models import Game, Focus, Material, Label, TrainingSession, Language
 
-logger = logging.getLogger(__name__)
-
 
 class GameFormTest(TestCase):
     """Test cases for GameForm"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up class-scoped test data"""
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
         
-        self.focus = Focus.objects.create(name="Dribbling")
-        self.material = Material.objects.create(name="Basketball")
-        self.label = Label.objects.create(name="Warm-up", color="#FF0000")
-        self.language, _ = Language.objects.get_or_create(code="en", defaults={"name": "English"})
-        
-        # Create a test game for update tests
-        self.game = Game.objects.create(
-            name='Test Game',
-            description='A test game for dribbling practice',
-            player_count='2',
-            duration='15min',
-            variants='Some variants',
-            created_by=self.user
-        )
-        self.game.focus.add(self.focus)
-        self.game.materials.add(self.material)
-        self.game.labels.add(self.label)
-        self.game.languages.add(self.language)
+        cls.focus = Focus.objects.create(name="Dribbling")
+        cls.material = Material.objects.create(name="Basketball")
+        cls.label = Label.objects.create(name="Warm-up", color="#FF0000")
+        cls.language, _ = Language.objects.get_or_create(code="en", defaults={"name": "English"})
     
     def test_game_form_valid(self):
         """Test that GameForm is valid with correct data"""
@@ -99,12 +83,26 @@ class GameFormTest(TestCase):
         self.assertEqual(game.created_by, self.user)
         
         # Check many-to-many relationships
-        self.assertIn(self.focus, game.focus.all())
-        self.assertIn(self.material, game.materials.all())
-        self.assertIn(self.label, game.labels.all())
+        self.assertTrue(game.focus.filter(pk=self.focus.pk).exists())
+        self.assertTrue(game.materials.filter(pk=self.material.pk).exists())
+        self.assertTrue(game.labels.filter(pk=self.label.pk).exists())
     
     def test_game_form_update(self):
         """Test that GameForm updates existing game correctly"""
+        # Only this test reads an existing game, so build it locally
+        game = Game.objects.create(
+            name='Test Game',
+            description='A test game for dribbling practice',
+            player_count='2',
+            duration='15min',
+            variants='Some variants',
+            created_by=self.user
+        )
+        game.focus.add(self.focus)
+        game.materials.add(self.material)
+        game.labels.add(self.label)
+        game.languages.add(self.language)
+        
         form_data = {
             'name': 'Updated Game',
             'description': 'Updated description',
@@ -117,10 +115,8 @@ class GameFormTest(TestCase):
             'variants': 'Updated variants'
         }
         
-        form = GameForm(data=form_data, instance=self.game)
-        if not form.is_valid():
-            print(f"Form errors: {form.errors}")
-        self.assertTrue(form.is_valid())
+        form = GameForm(data=form_data, instance=game)
+        self.assertTrue(form.is_valid(), form.errors)
         
         updated_game = form.save(commit=False)
         updated_game.save()
@@ -130,21 +126,22 @@ class GameFormTest(TestCase):
         self.assertEqual(updated_game.description, 'Updated description')
         self.assertEqual(updated_game.player_count, '5+')
         self.assertEqual(updated_game.duration, '15min')
-        self.assertIn(self.focus, updated_game.focus.all())
-        self.assertIn(self.material, updated_game.materials.all())
-        self.assertIn(self.label, updated_game.labels.all())
+        self.assertTrue(updated_game.focus.filter(pk=self.focus.pk).exists())
+        self.assertTrue(updated_game.materials.filter(pk=self.material.pk).exists())
+        self.assertTrue(updated_game.labels.filter(pk=self.label.pk).exists())
 
 
 class TrainingSessionFormTest(TestCase):
     """Test cases for TrainingSessionForm"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up class-scoped test data"""
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
-        self.language, _ = Language.objects.get_or_create(code="en", defaults={"name": "English"})
+        cls.language, _ = Language.objects.get_or_create(code="en", defaults={"name": "English"})
     
     def test_training_session_form_valid(self):
         """Test that TrainingSessionForm is valid with correct data"""
@@ -214,12 +211,13 @@ class TrainingSessionFormTest(TestCase):
 class GameSuggestionFormTest(TestCase):
     """Test cases for GameSuggestionForm"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.focus = Focus.objects.create(name="Dribbling")
-        self.material = Material.objects.create(name="Basketball")
-        self.label = Label.objects.create(name="Warm-up", color="#FF0000")
-        self.language, _ = Language.objects.get_or_create(code="en", defaults={"name": "English"})
+    @classmethod
+    def setUpTestData(cls):
+        """Set up class-scoped test data"""
+        cls.focus = Focus.objects.create(name="Dribbling")
+        cls.material = Material.objects.create(name="Basketball")
+        cls.label = Label.objects.create(name="Warm-up", color="#FF0000")
+        cls.language, _ = Language.objects.get_or_create(code="en", defaults={"name": "English"})
     
     def test_game_suggestion_form_valid(self):
         """Test that GameSuggestionForm is valid with correct data"""
@@ -283,9 +281,7 @@ class GameSuggestionFormTest(TestCase):
         }
         
         form = GameSuggestionForm(data=form_data)
-        if not form.is_valid():
-            print(f"Form errors: {form.errors}")
-        self.assertTrue(form.is_valid())
+        self.assertTrue(form.is_valid(), form.errors)
     
     def test_game_suggestion_form_clean_methods(self):
         """Test custom clean methods in GameSuggestionForm"""
@@ -302,9 +298,7 @@ class GameSuggestionFormTest(TestCase):
         }
         
         form = GameSuggestionForm(data=form_data)
-        if not form.is_valid():
-            print(f"Form errors: {form.errors}")
-        self.assertTrue(form.is_valid())
+        self.assertTrue(form.is_valid(), form.errors)
         cleaned_data = form.cleaned_data
         
         # Test that cleaned data contains expected fields
@@ -317,17 +311,18 @@ class GameSuggestionFormTest(TestCase):
 class FormIntegrationTest(TestCase):
     """Integration tests for forms with models"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up class-scoped test data"""
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
         
-        self.focus = Focus.objects.create(name="Dribbling")
-        self.material = Material.objects.create(name="Basketball")
-        self.label = Label.objects.create(name="Warm-up", color="#FF0000")
-        self.language, _ = Language.objects.get_or_create(code="en", defaults={"name": "English"})
+        cls.focus = Focus.objects.create(name="Dribbling")
+        cls.material = Material.objects.create(name="Basketball")
+        cls.label = Label.objects.create(name="Warm-up", color="#FF0000")
+        cls.language, _ = Language.objects.get_or_create(code="en", defaults={"name": "English"})
     
     def test_game_form_with_existing_relationships(self):
         """Test GameForm with existing focus, materials, and labels"""
@@ -381,40 +376,33 @@ class FormIntegrationTest(TestCase):
     
     def test_form_validation_error_handling(self):
         """Test that forms properly handle validation errors"""
-        # Test GameForm with missing required fields
-        form_data = {
-            'name': '',  # Required field missing
-            'description': 'A test game',
-            'player_count': '2',
-            'duration': '15min'
-        }
-        
-        form = GameForm(data=form_data)
-        self.assertFalse(form.is_valid())
-        self.assertIn('name', form.errors)
-        self.assertIn('focus', form.errors)  # focus is required
-        
-        # Test TrainingSessionForm with invalid data
-        form_data = {
-            'name': '',  # Empty name should cause validation error
-            'description': 'A test session',
-        }
-        
-        form = TrainingSessionForm(data=form_data)
-        self.assertFalse(form.is_valid())
-        self.assertIn('name', form.errors)
-        
-        # Test GameSuggestionForm with missing required fields
-        form_data = {
-            'name': '',  # Required field missing
-            'description': 'A suggested game',
-            'player_count': '2',
-            'duration': '15min',
-            'focus': [self.focus.id],
-            'materials': [self.material.id],
-            'labels': [self.label.id],
-        }
-        
-        form = GameSuggestionForm(data=form_data)
-        self.assertFalse(form.is_valid())
-        self.assertIn('name', form.errors) 
\ No newline at end of file
+        # The three invalid-data scenarios share their fixtures and run as
+        # subtests, so each failure is reported in isolation
+        cases = [
+            (GameForm, {
+                'name': '',  # Required field missing
+                'description': 'A test game',
+                'player_count': '2',
+                'duration': '15min'
+            }, ['name', 'focus']),  # focus is required
+            (TrainingSessionForm, {
+                'name': '',  # Empty name should cause validation error
+                'description': 'A test session',
+            }, ['name']),
+            (GameSuggestionForm, {
+                'name': '',  # Required field missing
+                'description': 'A suggested game',
+                'player_count': '2',
+                'duration': '15min',
+                'focus': [self.focus.id],
+                'materials': [self.material.id],
+                'labels': [self.label.id],
+            }, ['name']),
+        ]
+        
+        for form_cls, form_data, expected_errors in cases:
+            with self.subTest(form=form_cls.__name__):
+                form = form_cls(data=form_data)
+                self.assertFalse(form.is_valid())
+                for field in expected_errors:
+                    self.assertIn(field, form.errors) 
\ No newline at end of file
@@ -7,18 +7,31 @@ from games.models import ImpressumContent
 class ImpressumModalTest(TestCase):
     """Test the Impressum modal functionality"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.client = Client()
+    # One shared render (decoded once) for the tests that don't mutate
+    # state; the mutating and context tests keep their own GETs
+    _shared_body = None
+    
+    def _get_shared_body(self):
+        cls = type(self)
+        if cls._shared_body is None:
+            response = self.client.get(self.game_list_url)
+            self.assertEqual(response.status_code, 200)
+            cls._shared_body = response.content.decode()
+        return cls._shared_body
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Set up class-scoped test data"""
+        # Resolve the listing URL once per class
+        cls.game_list_url = reverse('game_list')
         
-        # Create test user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
         
         # Create sample Impressum content
-        self.impressum_content = ImpressumContent.objects.create(
+        cls.impressum_content = ImpressumContent.objects.create(
             title='Test Impressum Section',
             content='This is a test section for the Impressum modal.',
             is_active=True,
@@ -27,40 +40,37 @@ class ImpressumModalTest(TestCase):
     
     def test_impressum_link_in_footer(self):
         """Test that the Impressum link appears in the footer"""
-        response = self.client.get(reverse('game_list'))
-        self.assertEqual(response.status_code, 200)
-        self.assertContains(response, 'Impressum')
-        self.assertContains(response, 'data-bs-target="#impressumModal"')
+        body = self._get_shared_body()
+        self.assertIn('Impressum', body)
+        self.assertIn('data-bs-target="#impressumModal"', body)
     
     def test_impressum_modal_structure(self):
         """Test that the Impressum modal has the correct structure"""
-        response = self.client.get(reverse('game_list'))
-        self.assertEqual(response.status_code, 200)
+        body = self._get_shared_body()
         
         # Check for modal structure
-        self.assertContains(response, 'id="impressumModal"')
-        self.assertContains(response, 'impressumModalLabel')
-        self.assertContains(response, 'impressum-modal')
+        self.assertIn('id="impressumModal"', body)
+        self.assertIn('impressumModalLabel', body)
+        self.assertIn('impressum-modal', body)
     
     def test_impressum_content_display(self):
         """Test that Impressum content is displayed in the modal"""
-        response = self.client.get(reverse('game_list'))
-        self.assertEqual(response.status_code, 200)
+        body = self._get_shared_body()
         
         # Check for custom content
-        self.assertContains(response, 'Test Impressum Section')
-        self.assertContains(response, 'This is a test section for the Impressum modal.')
+        self.assertIn('Test Impressum Section', body)
+        self.assertIn('This is a test section for the Impressum modal.', body)
     
     def test_impressum_content_context(self):
         """Test that Impressum content is available in template context"""
-        response = self.client.get(reverse('game_list'))
+        response = self.client.get(self.game_list_url)
         self.assertEqual(response.status_code, 200)
         
-        # Check that impressum_content is in context
+        # Check that impressum_content is in context; the context value is
+        # the cached list, so compare the titles in one shot
         self.assertIn('impressum_content', response.context)
-        impressum_content = response.context['impressum_content']
-        self.assertEqual(len(impressum_content), 1)
-        self.assertEqual(impressum_content[0].title, 'Test Impressum Section')
+        titles = [content.title for content in response.context['impressum_content']]
+        self.assertEqual(titles, ['Test Impressum Section'])
     
     def test_impressum_content_inactive(self):
         """Test that inactive Impressum content is not displayed"""
@@ -68,7 +78,7 @@ class ImpressumModalTest(TestCase):
         self.impressum_content.is_active = False
         self.impressum_content.save()
         
-        response = self.client.get(reverse('game_list'))
+        response = self.client.get(self.game_list_url)
         self.assertEqual(response.status_code, 200)
         
         # Check that content is not displayed
@@ -84,43 +94,39 @@ class ImpressumModalTest(TestCase):
             order=2
         )
         
-        response = self.client.get(reverse('game_list'))
+        response = self.client.get(self.game_list_url)
         self.assertEqual(response.status_code, 200)
         
         # Check that content is in correct order
-        impressum_content = response.context['impressum_content']
-        self.assertEqual(len(impressum_content), 2)
-        self.assertEqual(impressum_content[0].title, 'Test Impressum Section')
-        self.assertEqual(impressum_content[1].title, 'Second Section')
+        titles = [content.title for content in response.context['impressum_content']]
+        self.assertEqual(titles, ['Test Impressum Section', 'Second Section'])
     
     def test_impressum_modal_translations(self):
         """Test that Impressum modal has proper translations"""
-        response = self.client.get(reverse('game_list'))
-        self.assertEqual(response.status_code, 200)
+        body = self._get_shared_body()
         
-        # Check for key translation strings
-        self.assertContains(response, 'Publisher Information')
-        self.assertContains(response, 'Contact Information')
-        self.assertContains(response, 'Content Responsibility')
-        self.assertContains(response, 'External Links')
-        self.assertContains(response, 'Copyright')
-        self.assertContains(response, 'Legal Information')
+        # Check for key translation strings in one pass
+        expected = (
+            'Publisher Information', 'Contact Information',
+            'Content Responsibility', 'External Links',
+            'Copyright', 'Legal Information',
+        )
+        missing = [needle for needle in expected if needle not in body]
+        self.assertFalse(missing, f'Missing from Impressum modal: {missing}')
     
     def test_impressum_modal_css_classes(self):
         """Test that Impressum modal has proper CSS classes"""
-        response = self.client.get(reverse('game_list'))
-        self.assertEqual(response.status_code, 200)
+        body = self._get_shared_body()
         
         # Check for CSS classes
-        self.assertContains(response, 'impressum-modal')
-        self.assertContains(response, 'impressum-content')
+        self.assertIn('impressum-modal', body)
+        self.assertIn('impressum-content', body)
     
     def test_impressum_link_accessibility(self):
         """Test that Impressum link is accessible"""
-        response = self.client.get(reverse('game_list'))
-        self.assertEqual(response.status_code, 200)
+        body = self._get_shared_body()
         
         # Check for proper link attributes
-        self.assertContains(response, 'href="#"')
-        self.assertContains(response, 'data-bs-toggle="modal"')
-        self.assertContains(response, 'data-bs-target="#impressumModal"') 
\ No newline at end of file
+        self.assertIn('href="#"', body)
+        self.assertIn('data-bs-toggle="modal"', body)
+        self.assertIn('data-bs-target="#impressumModal"', body) 
\ No newline at end of file
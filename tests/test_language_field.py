@@ -6,42 +6,62 @@ from games.models import Language, Game, Focus, Material, Label
 class LanguageFieldTest(TestCase):
     """Test the new multi-selection language field functionality"""
     
-    def setUp(self):
-        """Set up test data"""
-        # Create languages
-        self.english, _ = Language.objects.get_or_create(code='en', defaults={'name': 'English'})
-        self.german, _ = Language.objects.get_or_create(code='de', defaults={'name': 'Deutsch'})
+    @classmethod
+    def setUpTestData(cls):
+        """Set up class-scoped test data"""
+        # Create languages in one INSERT and fetch them back by code
+        Language.objects.bulk_create(
+            [Language(code='en', name='English'), Language(code='de', name='Deutsch')],
+            ignore_conflicts=True
+        )
+        languages_by_code = Language.objects.in_bulk(['en', 'de'], field_name='code')
+        cls.english = languages_by_code['en']
+        cls.german = languages_by_code['de']
         
         # Create a user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             password='testpass123'
         )
         
         # Create focus areas
-        self.focus = Focus.objects.create(name='Dribbling', description='Ball handling skills')
-        self.focus.languages.add(self.english, self.german)
+        cls.focus = Focus.objects.create(name='Dribbling', description='Ball handling skills')
         
         # Create materials
-        self.material = Material.objects.create(name='Basketball', description='Standard basketball')
-        self.material.languages.add(self.english, self.german)
+        cls.material = Material.objects.create(name='Basketball', description='Standard basketball')
         
         # Create labels
-        self.label = Label.objects.create(name='Beginner', color='#28a745')
-        self.label.languages.add(self.english)
+        cls.label = Label.objects.create(name='Beginner', color='#28a745')
         
         # Create a game
-        self.game = Game.objects.create(
+        cls.game = Game.objects.create(
             name='Basic Dribbling',
             description='Simple dribbling exercise',
             player_count='1-2',
             duration='10min',
-            created_by=self.user
+            created_by=cls.user
         )
-        self.game.focus.add(self.focus)
-        self.game.materials.add(self.material)
-        self.game.labels.add(self.label)
-        self.game.languages.add(self.english, self.german)
+        
+        # Write the M2M links through their through models, one batched
+        # insert per relation instead of an add() round-trip each
+        Focus.languages.through.objects.bulk_create([
+            Focus.languages.through(focus_id=cls.focus.id, language_id=cls.english.id),
+            Focus.languages.through(focus_id=cls.focus.id, language_id=cls.german.id),
+        ], ignore_conflicts=True)
+        Material.languages.through.objects.bulk_create([
+            Material.languages.through(material_id=cls.material.id, language_id=cls.english.id),
+            Material.languages.through(material_id=cls.material.id, language_id=cls.german.id),
+        ], ignore_conflicts=True)
+        Label.languages.through.objects.bulk_create([
+            Label.languages.through(label_id=cls.label.id, language_id=cls.english.id),
+        ], ignore_conflicts=True)
+        cls.game.focus.add(cls.focus)
+        cls.game.materials.add(cls.material)
+        cls.game.labels.add(cls.label)
+        Game.languages.through.objects.bulk_create([
+            Game.languages.through(game_id=cls.game.id, language_id=cls.english.id),
+            Game.languages.through(game_id=cls.game.id, language_id=cls.german.id),
+        ], ignore_conflicts=True)
     
     def test_language_model(self):
         """Test Language model creation and string representation"""
@@ -53,26 +73,26 @@ class LanguageFieldTest(TestCase):
     def test_focus_languages(self):
         """Test that focus areas can have multiple languages"""
         self.assertEqual(self.focus.languages.count(), 2)
-        self.assertIn(self.english, self.focus.languages.all())
-        self.assertIn(self.german, self.focus.languages.all())
+        self.assertTrue(self.focus.languages.filter(pk=self.english.pk).exists())
+        self.assertTrue(self.focus.languages.filter(pk=self.german.pk).exists())
     
     def test_material_languages(self):
         """Test that materials can have multiple languages"""
         self.assertEqual(self.material.languages.count(), 2)
-        self.assertIn(self.english, self.material.languages.all())
-        self.assertIn(self.german, self.material.languages.all())
+        self.assertTrue(self.material.languages.filter(pk=self.english.pk).exists())
+        self.assertTrue(self.material.languages.filter(pk=self.german.pk).exists())
     
     def test_label_languages(self):
         """Test that labels can have multiple languages"""
         self.assertEqual(self.label.languages.count(), 1)
-        self.assertIn(self.english, self.label.languages.all())
-        self.assertNotIn(self.german, self.label.languages.all())
+        self.assertTrue(self.label.languages.filter(pk=self.english.pk).exists())
+        self.assertFalse(self.label.languages.filter(pk=self.german.pk).exists())
     
     def test_game_languages(self):
         """Test that games can have multiple languages"""
         self.assertEqual(self.game.languages.count(), 2)
-        self.assertIn(self.english, self.game.languages.all())
-        self.assertIn(self.german, self.game.languages.all())
+        self.assertTrue(self.game.languages.filter(pk=self.english.pk).exists())
+        self.assertTrue(self.game.languages.filter(pk=self.german.pk).exists())
     
     def test_get_languages_display(self):
         """Test the get_languages_display method"""
@@ -33,6 +33,7 @@ MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
+    'games.middleware.SessionLanguageMiddleware',  # Apply session language preference
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
@@ -67,6 +68,8 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': ':memory:',
+        # Keep the test database in RAM as well (e.g. under --keepdb)
+        'TEST': {'NAME': ':memory:'},
     }
 }
 
@@ -165,6 +168,9 @@ LOGS_DIR.mkdir(exist_ok=True)
 # Test-specific settings
 TEST_RUNNER = 'django.test.runner.DiscoverRunner'
 
+# Fast password hashing for tests; PBKDF2 dominates user-fixture setUp time
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 # Enable migrations for tests to ensure proper database setup
 MIGRATION_MODULES = {}
 